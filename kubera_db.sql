@@ -1,31 +1,32 @@
-CREATE TABLE `Healthcare_Providers` (
+CREATE TABLE `healthcare_providers` (
     `provider_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
     `name` VARCHAR(255) NOT NULL
 );
 
-CREATE TABLE `Payors` (
+CREATE TABLE `payors` (
     `payor_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
-    `name` VARCHAR(255) NOT NULL
+    `name` VARCHAR(255) NOT NULL,
+    UNIQUE KEY `payors_name_unique` (`name`)
 );
 
-CREATE TABLE `Documents` (
+CREATE TABLE `documents` (
     `document_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
     `filename` VARCHAR(255) NOT NULL,
     `file_path` TEXT NOT NULL
 );
 
-CREATE TABLE `Contracts` (
+CREATE TABLE `contracts` (
     `contract_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
     `document_id` BIGINT UNSIGNED NOT NULL,
     `provider_id` BIGINT UNSIGNED NOT NULL,
     `payor_id` BIGINT UNSIGNED NOT NULL,
     `effective_date` DATE NOT NULL,
-    `termination_date` DATE NOT NULL,
+    `termination_notice_period` INT NULL,
     `stop_loss_threshold` DECIMAL(8, 2) NOT NULL,
     `created_at` TIMESTAMP NOT NULL
 );
 
-CREATE TABLE `Amendments` (
+CREATE TABLE `amendments` (
     `amendment_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
     `contract_id` BIGINT UNSIGNED NOT NULL,
     `amendment_date` DATE NOT NULL,
@@ -33,7 +34,7 @@ CREATE TABLE `Amendments` (
     `created_at` TIMESTAMP NOT NULL
 );
 
-CREATE TABLE `Contract_Terms` (
+CREATE TABLE `contract_terms` (
     `term_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
     `contract_id` BIGINT UNSIGNED NOT NULL,
     `term_name` VARCHAR(255) NOT NULL,
@@ -41,7 +42,7 @@ CREATE TABLE `Contract_Terms` (
     `created_at` TIMESTAMP NOT NULL
 );
 
-CREATE TABLE `Contract_Term_Revisions` (
+CREATE TABLE `contract_term_revisions` (
     `revision_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
     `contract_term_id` BIGINT UNSIGNED NOT NULL,
     `amendment_id` BIGINT UNSIGNED NOT NULL,
@@ -51,26 +52,26 @@ CREATE TABLE `Contract_Term_Revisions` (
     `created_at` TIMESTAMP NOT NULL
 );
 
-ALTER TABLE `Contracts`
+ALTER TABLE `contracts`
     ADD CONSTRAINT `contracts_payor_id_foreign` 
-        FOREIGN KEY(`payor_id`) REFERENCES `Payors`(`payor_id`),
+        FOREIGN KEY(`payor_id`) REFERENCES `payors`(`payor_id`),
     ADD CONSTRAINT `contracts_document_id_foreign` 
-        FOREIGN KEY(`document_id`) REFERENCES `Documents`(`document_id`),
+        FOREIGN KEY(`document_id`) REFERENCES `documents`(`document_id`),
     ADD CONSTRAINT `contracts_provider_id_foreign` 
-        FOREIGN KEY(`provider_id`) REFERENCES `Healthcare_Providers`(`provider_id`);
+        FOREIGN KEY(`provider_id`) REFERENCES `healthcare_providers`(`provider_id`);
 
-ALTER TABLE `Amendments`
+ALTER TABLE `amendments`
     ADD CONSTRAINT `amendments_contract_id_foreign` 
-        FOREIGN KEY(`contract_id`) REFERENCES `Contracts`(`contract_id`),
+        FOREIGN KEY(`contract_id`) REFERENCES `contracts`(`contract_id`),
     ADD CONSTRAINT `amendments_document_id_foreign` 
-        FOREIGN KEY(`document_id`) REFERENCES `Documents`(`document_id`);
+        FOREIGN KEY(`document_id`) REFERENCES `documents`(`document_id`);
 
-ALTER TABLE `Contract_Term_Revisions`
+ALTER TABLE `contract_term_revisions`
     ADD CONSTRAINT `contract_term_revisions_amendment_id_foreign` 
-        FOREIGN KEY(`amendment_id`) REFERENCES `Amendments`(`amendment_id`),
+        FOREIGN KEY(`amendment_id`) REFERENCES `amendments`(`amendment_id`),
     ADD CONSTRAINT `contract_term_revisions_contract_term_id_foreign` 
-        FOREIGN KEY(`contract_term_id`) REFERENCES `Contract_Terms`(`term_id`);
+        FOREIGN KEY(`contract_term_id`) REFERENCES `contract_terms`(`term_id`);
 
-ALTER TABLE `Contract_Terms`
+ALTER TABLE `contract_terms`
     ADD CONSTRAINT `contract_terms_contract_id_foreign` 
-        FOREIGN KEY(`contract_id`) REFERENCES `Contracts`(`contract_id`);
\ No newline at end of file
+        FOREIGN KEY(`contract_id`) REFERENCES `contracts`(`contract_id`);
\ No newline at end of file
@@ -0,0 +1,22 @@
+-- Adds the UNIQUE index on payors.name to an existing kubera_db.
+-- database_ingest.py upserts payors with INSERT ... ON DUPLICATE KEY UPDATE, which
+-- silently inserts a duplicate payor on every ingest unless this index exists.
+
+-- Point contracts at the lowest payor_id for each name
+UPDATE `contracts` c
+    JOIN `payors` p ON p.`payor_id` = c.`payor_id`
+    JOIN (
+        SELECT `name`, MIN(`payor_id`) AS `keep_id`
+        FROM `payors`
+        GROUP BY `name`
+    ) k ON k.`name` = p.`name`
+SET c.`payor_id` = k.`keep_id`
+WHERE c.`payor_id` <> k.`keep_id`;
+
+-- Remove the now-unreferenced duplicate payors
+DELETE p
+FROM `payors` p
+    JOIN `payors` keep ON keep.`name` = p.`name` AND keep.`payor_id` < p.`payor_id`;
+
+ALTER TABLE `payors`
+    ADD UNIQUE KEY `payors_name_unique` (`name`);
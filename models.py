@@ -0,0 +1,74 @@
+from sqlalchemy import BigInteger, Column, Date, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy.orm import declarative_base
+
+
+# Declarative models for the kubera_db schema (see kubera_db.sql), so the ingest
+# doesn't have to reflect the database at startup
+Base = declarative_base()
+
+
+class Healthcare_Provider(Base):
+    __tablename__ = 'healthcare_providers'
+
+    provider_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+
+
+class Payor(Base):
+    __tablename__ = 'payors'
+
+    payor_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False, unique=True)
+
+
+class Document(Base):
+    __tablename__ = 'documents'
+
+    document_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    filename = Column(String(255), nullable=False)
+    file_path = Column(Text, nullable=False)
+
+
+class Contract(Base):
+    __tablename__ = 'contracts'
+
+    contract_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    document_id = Column(BigInteger, ForeignKey('documents.document_id'), nullable=False)
+    provider_id = Column(BigInteger, ForeignKey('healthcare_providers.provider_id'), nullable=False)
+    payor_id = Column(BigInteger, ForeignKey('payors.payor_id'), nullable=False)
+    effective_date = Column(Date, nullable=False)
+    termination_notice_period = Column(Integer)  # Notice period in days
+    stop_loss_threshold = Column(Numeric(8, 2), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+class Amendment(Base):
+    __tablename__ = 'amendments'
+
+    amendment_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    contract_id = Column(BigInteger, ForeignKey('contracts.contract_id'), nullable=False)
+    amendment_date = Column(Date, nullable=False)
+    document_id = Column(BigInteger, ForeignKey('documents.document_id'), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+class Contract_Terms(Base):
+    __tablename__ = 'contract_terms'
+
+    term_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    contract_id = Column(BigInteger, ForeignKey('contracts.contract_id'), nullable=False)
+    term_name = Column(String(255), nullable=False)
+    term_value = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+class Contract_Term_Revision(Base):
+    __tablename__ = 'contract_term_revisions'
+
+    revision_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    contract_term_id = Column(BigInteger, ForeignKey('contract_terms.term_id'), nullable=False)
+    amendment_id = Column(BigInteger, ForeignKey('amendments.amendment_id'), nullable=False)
+    prev_value = Column(Text, nullable=False)
+    new_value = Column(Text, nullable=False)
+    changed_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False)